@@ -1,9 +1,10 @@
 import asyncio
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Callable
 from types import MethodType
 
 from .attributes import AttrR, AttrW, Sender, Updater
+from .controller import BaseController
 from .exceptions import FastCSException
 from .mapping import Mapping, SingleMapping
 
@@ -40,9 +41,70 @@ def _add_scan_method_tasks(
         )
 
 
-def _create_updater_callback(attribute, controller):
+class _UpdateBatcher:
+    """Coalesce updates of a controller's attributes scanned at the same period.
+
+    The first submission creates a drain task, which the event loop runs after the
+    callbacks already scheduled alongside it, e.g. the rest of a scan task's
+    ``gather``. Everything submitted by then is passed to
+    ``BaseController.bulk_update`` together, so a controller can service all of them
+    with a single query to the device. Each attribute then gets its own outcome.
+    """
+
+    def __init__(self, controller: BaseController):
+        self._controller = controller
+        self._pending: deque[tuple[AttrR, asyncio.Future]] = deque()
+        self._drain_scheduled = False
+        # The event loop only keeps weak references to tasks
+        self._drain_tasks: set[asyncio.Task] = set()
+
+    def submit(self, attribute: AttrR) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((attribute, future))
+
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            task = loop.create_task(self._drain())
+            self._drain_tasks.add(task)
+            task.add_done_callback(self._drain_tasks.discard)
+
+        return future
+
+    async def _drain(self) -> None:
+        self._drain_scheduled = False
+        batch = list(self._pending)
+        self._pending.clear()
+
+        try:
+            outcomes = await self._controller.bulk_update(
+                [attribute for attribute, _ in batch]
+            )
+            if outcomes is None:
+                outcomes = [None] * len(batch)
+            elif len(outcomes) != len(batch):
+                raise FastCSException(
+                    f"bulk_update returned {len(outcomes)} outcomes "
+                    f"for {len(batch)} attributes"
+                )
+        except Exception as e:
+            outcomes = [e] * len(batch)
+
+        for (_, future), outcome in zip(batch, outcomes, strict=True):
+            if future.done():
+                continue
+
+            if outcome is None:
+                future.set_result(None)
+            else:
+                future.set_exception(outcome)
+
+
+def _create_updater_callback(attribute, batcher: _UpdateBatcher):
+    submit = batcher.submit
+
     async def callback():
-        await attribute.updater.update(controller, attribute)
+        await submit(attribute)
 
     return callback
 
@@ -50,12 +112,15 @@ def _create_updater_callback(attribute, controller):
 def _add_attribute_updater_tasks(
     scan_dict: dict[float, list[Callable]], single_mapping: SingleMapping
 ):
+    # One batcher per scan period, so batching stays within a single scan task
+    batchers: dict[float, _UpdateBatcher] = {}
     for attribute in single_mapping.attributes.values():
         match attribute:
             case AttrR(updater=Updater(update_period=update_period)) as attribute:
-                callback = _create_updater_callback(
-                    attribute, single_mapping.controller
-                )
+                if update_period not in batchers:
+                    batchers[update_period] = _UpdateBatcher(single_mapping.controller)
+
+                callback = _create_updater_callback(attribute, batchers[update_period])
                 scan_dict[update_period].append(callback)
 
 
@@ -88,8 +153,10 @@ def _link_single_controller_put_tasks(single_mapping: SingleMapping) -> None:
 
 
 def _create_sender_callback(attribute, controller):
+    put = attribute.sender.put
+
     async def callback(value):
-        await attribute.sender.put(controller, attribute, value)
+        await put(controller, attribute, value)
 
     return callback
 
@@ -1,5 +1,6 @@
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from types import MethodType
 from typing import Any
 
@@ -83,12 +84,18 @@ def _create_and_link_command_pv(pv_name: str, method: Callable) -> None:
     builder.aOut(pv_name, initial_value=0, always_update=True, on_update=wrapped_method)
 
 
-def _create_and_link_attribute_pvs(mapping: Mapping) -> None:
+@lru_cache
+def _get_record_name(attr_name: str) -> str:
+    return attr_name.title().replace("_", "")
+
+
+def _create_and_link_pvs(mapping: Mapping) -> None:
     for single_mapping in mapping.get_controller_mappings():
         path = single_mapping.controller.path
+        pv_prefix = f"{':'.join(path)}:" if path else ""
+
         for attr_name, attribute in single_mapping.attributes.items():
-            attr_name = attr_name.title().replace("_", "")
-            pv_name = f"{':'.join(path)}:{attr_name}" if path else attr_name
+            pv_name = pv_prefix + _get_record_name(attr_name)
 
             match attribute:
                 case AttrRW():
@@ -99,13 +106,8 @@ def _create_and_link_attribute_pvs(mapping: Mapping) -> None:
                 case AttrW():
                     _create_and_link_write_pv(pv_name, attribute)
 
-
-def _create_and_link_command_pvs(mapping: Mapping) -> None:
-    for single_mapping in mapping.get_controller_mappings():
-        path = single_mapping.controller.path
         for attr_name, method in single_mapping.command_methods.items():
-            attr_name = attr_name.title().replace("_", "")
-            pv_name = f"{':'.join(path)}:{attr_name}" if path else attr_name
+            pv_name = pv_prefix + _get_record_name(attr_name)
 
             _create_and_link_command_pv(
                 pv_name, MethodType(method.fn, single_mapping.controller)
@@ -128,9 +130,7 @@ class EpicsIOC:
         # Set the record prefix
         builder.SetDeviceName(self._pv_prefix)
 
-        _create_and_link_attribute_pvs(self._mapping)
-
-        _create_and_link_command_pvs(self._mapping)
+        _create_and_link_pvs(self._mapping)
 
         # Boilerplate to get the IOC started
         builder.LoadDatabase()
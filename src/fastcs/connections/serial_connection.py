@@ -1,8 +1,14 @@
 import asyncio
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 
 import aioserial
 
+# Either the number of bytes to read into a new ``bytes``, or a buffer to read into
+ResponseTarget = int | bytearray | memoryview
+# A message, what to do with its response (``None`` for commands) and its result
+_Request = tuple[bytes, ResponseTarget | None, asyncio.Future]
+
 
 class NotOpenedError(Exception):
     pass
@@ -14,39 +20,225 @@ class SerialConnectionSettings:
     baud: int = 115200
 
 
+_NOT_OPENED_MESSAGE = "Need to call connect() before using SerialConnection."
+_CLOSING_MESSAGE = "SerialConnection is closing."
+_CLOSED_MESSAGE = "SerialConnection was closed before the request completed."
+
+
+def _set_exception(future: asyncio.Future, exception: Exception) -> None:
+    if not future.done():
+        future.set_exception(exception)
+
+
+def _reject_queued(queue: asyncio.Queue) -> None:
+    while not queue.empty():
+        future = queue.get_nowait()[-1]
+        queue.task_done()
+        _set_exception(future, NotOpenedError(_CLOSED_MESSAGE))
+
+
+class _ClosedState:
+    """I/O of a ``SerialConnection`` before ``connect()`` or after ``close()``."""
+
+    stream = None
+
+    def ensure_open(self) -> None:
+        raise NotOpenedError(_NOT_OPENED_MESSAGE)
+
+    def close(self) -> None:
+        raise NotOpenedError(_NOT_OPENED_MESSAGE)
+
+    def closing(self) -> "_ClosingState":
+        raise NotOpenedError(_NOT_OPENED_MESSAGE)
+
+    async def submit(self, request: _Request) -> None:
+        raise NotOpenedError(_NOT_OPENED_MESSAGE)
+
+    async def write(self, message: bytes) -> None:
+        raise NotOpenedError(_NOT_OPENED_MESSAGE)
+
+    async def read(self, size: int) -> bytes:
+        raise NotOpenedError(_NOT_OPENED_MESSAGE)
+
+    async def readinto(self, buffer: bytearray | memoryview) -> int:
+        raise NotOpenedError(_NOT_OPENED_MESSAGE)
+
+
+class _OpenState:
+    """I/O of a connected ``SerialConnection``, with no open check on each call."""
+
+    def __init__(
+        self,
+        stream: aioserial.AioSerial,
+        submit: Callable[[_Request], Awaitable[None]],
+    ) -> None:
+        self.stream = stream
+        self.submit = submit
+        self.write = stream.write_async
+        self.read = stream.read_async
+        self.readinto = stream.readinto_async
+
+    def ensure_open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.stream.close()
+
+    def closing(self) -> "_ClosingState":
+        return _ClosingState(self.stream)
+
+
+class _ClosingState(_OpenState):
+    """I/O of a ``SerialConnection`` finishing queued requests inside ``close()``."""
+
+    def __init__(self, stream: aioserial.AioSerial) -> None:
+        super().__init__(stream, self._reject)
+
+    def ensure_open(self) -> None:
+        raise NotOpenedError(_CLOSING_MESSAGE)
+
+    def closing(self) -> "_ClosingState":
+        raise NotOpenedError(_CLOSING_MESSAGE)
+
+    async def _reject(self, request: _Request) -> None:
+        raise NotOpenedError(_CLOSING_MESSAGE)
+
+
 class SerialConnection:
-    def __init__(self):
-        self.stream = None
-        self._lock = asyncio.Lock()
+    """Serial connection that pipelines requests to the device.
+
+    Messages are written in the order they are sent by a single writer task, while a
+    single reader task reads the responses to queries back in the same order. This
+    lets the next request go out while the device is still answering the previous one.
+    """
+
+    def __init__(self) -> None:
+        self._io: _ClosedState | _OpenState = _ClosedState()
+        self._tx_queue: asyncio.Queue[_Request] = asyncio.Queue()
+        self._rx_queue: asyncio.Queue[tuple[ResponseTarget, asyncio.Future]] = (
+            asyncio.Queue()
+        )
+        self._writer_task: asyncio.Task | None = None
+        self._reader_task: asyncio.Task | None = None
 
     async def connect(self, settings: SerialConnectionSettings) -> None:
-        self.stream = aioserial.AioSerial(port=settings.port, baudrate=settings.baud)
+        if not isinstance(self._io, _ClosedState):
+            # Reconnecting replaces the port, but there must only be one reader
+            await self.close()
+
+        stream = aioserial.AioSerial(port=settings.port, baudrate=settings.baud)
+        self._io = _OpenState(stream, self._tx_queue.put)
+
+        loop = asyncio.get_running_loop()
+        self._writer_task = loop.create_task(self._writer())
+        self._reader_task = loop.create_task(self._reader())
+
+    @property
+    def stream(self) -> aioserial.AioSerial | None:
+        """The open port, or ``None`` if not connected.
+
+        This is read-only. The port is created by ``connect()``, which also starts the
+        tasks that service it, so to use a test double patch ``aioserial.AioSerial``.
+        """
+        return self._io.stream
 
     def ensure_open(self):
-        if self.stream is None:
-            raise NotOpenedError(
-                "Need to call connect() before using SerialConnection."
-            )
+        self._io.ensure_open()
 
     async def send_command(self, message: bytes) -> None:
-        async with self._lock:
-            self.ensure_open()
-            await self._send_message(message)
+        await self._submit(message, None)
 
     async def send_query(self, message: bytes, response_size: int) -> bytes:
-        async with self._lock:
-            self.ensure_open()
-            await self._send_message(message)
-            return await self._receive_response(response_size)
+        return await self._submit(message, response_size)
+
+    async def send_query_into(
+        self, message: bytes, buffer: bytearray | memoryview
+    ) -> memoryview:
+        """Send a query and read a response of ``len(buffer)`` bytes into ``buffer``.
+
+        This avoids allocating a new ``bytes`` for every response when polling at a
+        high rate. The returned view shares memory with ``buffer``, so it is only valid
+        until ``buffer`` is reused.
+        """
+        return await self._submit(message, buffer)
 
     async def close(self) -> None:
-        async with self._lock:
-            self.ensure_open()
-            self.stream.close()
-            self.stream = None
+        # Reject new requests, but let those already queued complete before closing
+        self._io = self._io.closing()
+        try:
+            await self._tx_queue.join()
+            await self._rx_queue.join()
+        finally:
+            tasks = [task for task in (self._writer_task, self._reader_task) if task]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._writer_task, self._reader_task = (None, None)
+
+            # Only left over if close() itself was cancelled while waiting
+            _reject_queued(self._tx_queue)
+            _reject_queued(self._rx_queue)
+
+            self._io.close()
+            self._io = _ClosedState()
+
+    async def _submit(self, message: bytes, response: ResponseTarget | None):
+        future = asyncio.get_running_loop().create_future()
+        await self._io.submit((message, response, future))
+        return await future
+
+    async def _writer(self) -> None:
+        while True:
+            message, response, future = await self._tx_queue.get()
+            if future.done():
+                # The caller gave up before this was sent, so do not send it late.
+                # Nothing is written, so later responses still pair up in order.
+                self._tx_queue.task_done()
+                continue
+
+            try:
+                await self._send_message(message)
+            except asyncio.CancelledError:
+                _set_exception(future, NotOpenedError(_CLOSED_MESSAGE))
+                raise
+            except Exception as e:
+                _set_exception(future, e)
+            else:
+                if response is None:
+                    if not future.done():
+                        future.set_result(None)
+                else:
+                    await self._rx_queue.put((response, future))
+            finally:
+                self._tx_queue.task_done()
+
+    async def _reader(self) -> None:
+        while True:
+            response, future = await self._rx_queue.get()
+            try:
+                # Always read the response, even if the caller has given up on it,
+                # so that later responses are not misattributed
+                if isinstance(response, int):
+                    result = await self._receive_response(response)
+                else:
+                    size = await self._receive_response_into(response)
+                    result = memoryview(response)[:size]
+            except asyncio.CancelledError:
+                _set_exception(future, NotOpenedError(_CLOSED_MESSAGE))
+                raise
+            except Exception as e:
+                _set_exception(future, e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self._rx_queue.task_done()
 
     async def _send_message(self, message):
-        await self.stream.write_async(message)
+        await self._io.write(message)
 
     async def _receive_response(self, size):
-        return await self.stream.read_async(size)
+        return await self._io.read(size)
+
+    async def _receive_response_into(self, buffer):
+        return await self._io.readinto(buffer)
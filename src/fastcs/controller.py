@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 from copy import copy
 
-from .attributes import Attribute
+from .attributes import Attribute, AttrR
 
 
 class BaseController:
@@ -30,6 +31,31 @@ class BaseController:
     def get_sub_controllers(self) -> list[SubController]:
         return self.__sub_controllers
 
+    async def bulk_update(
+        self, attributes: list[AttrR]
+    ) -> list[BaseException | None] | None:
+        """Update the readback values of several ``AttrR``s polled together.
+
+        The backend collects updates due in the same scan cycle and passes them here
+        in one call. Override this to fetch them from the device in a single query;
+        by default each ``Updater`` is called concurrently.
+
+        Return the outcome of each update in the order of ``attributes``, either
+        ``None`` or the exception it raised, or return ``None`` if all of them
+        succeeded. An exception raised from here fails every attribute in the batch.
+        """
+
+        async def update(attribute: AttrR) -> None:
+            if attribute.updater is not None:
+                await attribute.updater.update(self, attribute)
+
+        results = await asyncio.gather(
+            *[update(attribute) for attribute in attributes], return_exceptions=True
+        )
+        return [
+            result if isinstance(result, BaseException) else None for result in results
+        ]
+
 
 class Controller(BaseController):
     """Top-level controller for a device.
@@ -0,0 +1,138 @@
+import asyncio
+
+from fastcs.attributes import AttrR
+from fastcs.backend import _get_scan_tasks, _UpdateBatcher
+from fastcs.controller import Controller
+from fastcs.datatypes import Int
+from fastcs.mapping import Mapping
+
+
+class CountingUpdater:
+    def __init__(self, update_period: float = 1.0):
+        self.update_period = update_period
+
+    async def update(self, controller, attr):
+        await attr.set(attr.get() + 1)
+
+
+class FailingUpdater:
+    update_period = 1.0
+
+    async def update(self, controller, attr):
+        raise ValueError("Device did not respond")
+
+
+class BulkController(Controller):
+    a = AttrR(Int(), handler=CountingUpdater())
+    b = AttrR(Int(), handler=CountingUpdater())
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[AttrR]] = []
+
+    async def bulk_update(self, attributes):
+        self.batches.append(list(attributes))
+        return await super().bulk_update(attributes)
+
+
+def run_one_cycle(controller: Controller) -> None:
+    scan_tasks = _get_scan_tasks(Mapping(controller))
+
+    async def run():
+        tasks = [asyncio.create_task(scan_task()) for scan_task in scan_tasks]
+        await asyncio.sleep(0.1)
+        for task in tasks:
+            task.cancel()
+
+    asyncio.run(run())
+
+
+def test_attribute_updates_are_batched_per_controller():
+    controller = BulkController()
+    run_one_cycle(controller)
+
+    assert len(controller.batches) == 1
+    assert set(map(id, controller.batches[0])) == {id(controller.a), id(controller.b)}
+    assert controller.a.get() == controller.b.get() == 1
+
+
+def test_default_bulk_update_calls_each_updater():
+    class PlainController(Controller):
+        a = AttrR(Int(), handler=CountingUpdater())
+        b = AttrR(Int(), handler=CountingUpdater())
+
+    controller = PlainController()
+    run_one_cycle(controller)
+
+    assert controller.a.get() == controller.b.get() == 1
+
+
+def test_updater_error_only_reaches_its_own_attribute():
+    class FailingController(Controller):
+        a = AttrR(Int(), handler=FailingUpdater())
+        b = AttrR(Int(), handler=CountingUpdater())
+
+    controller = FailingController()
+    batcher = _UpdateBatcher(controller)
+
+    async def submit_both():
+        return await asyncio.gather(
+            batcher.submit(controller.a),
+            batcher.submit(controller.b),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(submit_both())
+
+    assert isinstance(results[0], ValueError)
+    assert str(results[0]) == "Device did not respond"
+    assert results[1] is None
+    assert controller.b.get() == 1
+
+
+def test_bulk_update_error_reaches_every_attribute_in_batch():
+    class RaisingController(Controller):
+        a = AttrR(Int(), handler=CountingUpdater())
+        b = AttrR(Int(), handler=CountingUpdater())
+
+        async def bulk_update(self, attributes):
+            raise ValueError("Device did not respond")
+
+    controller = RaisingController()
+    batcher = _UpdateBatcher(controller)
+
+    async def submit_both():
+        return await asyncio.gather(
+            batcher.submit(controller.a),
+            batcher.submit(controller.b),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(submit_both())
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_attributes_with_different_periods_are_batched_separately():
+    class MixedPeriodController(BulkController):
+        a = AttrR(Int(), handler=CountingUpdater(update_period=1.0))
+        b = AttrR(Int(), handler=CountingUpdater(update_period=2.0))
+
+    controller = MixedPeriodController()
+    assert len(_get_scan_tasks(Mapping(controller))) == 2
+
+    run_one_cycle(controller)
+
+    assert sorted(map(len, controller.batches)) == [1, 1]
+    assert controller.a.get() == controller.b.get() == 1
+
+
+def test_failing_attribute_does_not_stop_other_scan_periods():
+    class MixedPeriodController(Controller):
+        slow = AttrR(Int(), handler=FailingUpdater())
+        fast = AttrR(Int(), handler=CountingUpdater(update_period=0.01))
+
+    controller = MixedPeriodController()
+    run_one_cycle(controller)
+
+    assert controller.fast.get() > 1
@@ -0,0 +1,287 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from fastcs.connections.serial_connection import (
+    NotOpenedError,
+    SerialConnection,
+    SerialConnectionSettings,
+)
+
+SETTINGS = SerialConnectionSettings(port="/dev/ttyFAKE")
+
+
+class FakeStream:
+    """Stand-in for ``aioserial.AioSerial`` that replies to known messages."""
+
+    def __init__(self, **kwargs) -> None:
+        self.replies: dict[bytes, bytes] = {}
+        self.write_errors: dict[bytes, Exception] = {}
+        self.read_errors: list[Exception] = []
+        self.written: list[bytes] = []
+        self.closed = False
+        self.writable = asyncio.Event()
+        self.writable.set()
+        self._buffer = bytearray()
+        self._data_ready = asyncio.Event()
+
+    def feed(self, data: bytes) -> None:
+        self._buffer += data
+        self._data_ready.set()
+
+    async def write_async(self, data: bytes) -> int:
+        await asyncio.sleep(0)
+        await self.writable.wait()
+        if data in self.write_errors:
+            raise self.write_errors[data]
+        self.written.append(data)
+        if data in self.replies:
+            self.feed(self.replies[data])
+        return len(data)
+
+    async def read_async(self, size: int) -> bytes:
+        while len(self._buffer) < size:
+            self._data_ready.clear()
+            await self._data_ready.wait()
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        if self.read_errors:
+            raise self.read_errors.pop(0)
+        return data
+
+    async def readinto_async(self, buffer: bytearray) -> int:
+        data = await self.read_async(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def stream():
+    fake = FakeStream()
+    with mock.patch("aioserial.AioSerial", return_value=fake):
+        yield fake
+
+
+async def wait_for_writes(stream: FakeStream, count: int) -> None:
+    while len(stream.written) < count:
+        await asyncio.sleep(0)
+
+
+def test_concurrent_queries_are_paired_with_responses_in_order(stream):
+    stream.replies = {b"A?": b"1", b"B?": b"22", b"C?": b"333"}
+
+    async def run():
+        connection = SerialConnection()
+        await connection.connect(SETTINGS)
+        responses = await asyncio.gather(
+            connection.send_query(b"A?", 1),
+            connection.send_query(b"B?", 2),
+            connection.send_query(b"C?", 3),
+        )
+        await connection.close()
+        return responses
+
+    assert asyncio.run(run()) == [b"1", b"22", b"333"]
+    assert stream.written == [b"A?", b"B?", b"C?"]
+
+
+def test_send_command_resolves_after_write(stream):
+    async def run():
+        connection = SerialConnection()
+        await connection.connect(SETTINGS)
+        await connection.send_command(b"GO")
+        assert stream.written == [b"GO"]
+        await connection.close()
+
+    asyncio.run(run())
+
+
+def test_cancelled_query_does_not_shift_later_responses(stream):
+    async def run():
+        connection = SerialConnection()
+        await connection.connect(SETTINGS)
+        first = asyncio.create_task(connection.send_query(b"A?", 1))
+        second = asyncio.create_task(connection.send_query(b"B?", 1))
+        await wait_for_writes(stream, 2)
+
+        first.cancel()
+        stream.feed(b"12")
+
+        assert await second == b"2"
+        assert first.cancelled()
+        await connection.close()
+
+    asyncio.run(run())
+
+
+def test_request_abandoned_before_write_is_not_sent(stream):
+    stream.replies = {b"C?": b"3"}
+
+    async def run():
+        connection = SerialConnection()
+        await connection.connect(SETTINGS)
+        stream.writable.clear()
+        first = asyncio.create_task(connection.send_command(b"FIRST"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(connection.send_command(b"ABORTED"), 0.01)
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(connection.send_query(b"B?", 1), 0.01)
+
+        stream.writable.set()
+        await first
+        assert await connection.send_query(b"C?", 1) == b"3"
+        await connection.close()
+
+    asyncio.run(run())
+    assert stream.written == [b"FIRST", b"C?"]
+
+
+def test_write_error_reaches_its_caller(stream):
+    stream.write_errors = {b"A?": OSError("write failed")}
+    stream.replies = {b"B?": b"2"}
+
+    async def run():
+        connection = SerialConnection()
+        await connection.connect(SETTINGS)
+        results = await asyncio.gather(
+            connection.send_query(b"A?", 1),
+            connection.send_query(b"B?", 1),
+            return_exceptions=True,
+        )
+        await connection.close()
+        return results
+
+    error, response = asyncio.run(run())
+    assert isinstance(error, OSError)
+    assert str(error) == "write failed"
+    assert response == b"2"
+
+
+def test_read_error_reaches_its_caller(stream):
+    stream.replies = {b"A?": b"1", b"B?": b"2"}
+    stream.read_errors = [OSError("read failed")]
+
+    async def run():
+        connection = SerialConnection()
+        await connection.connect(SETTINGS)
+        results = await asyncio.gather(
+            connection.send_query(b"A?", 1),
+            connection.send_query(b"B?", 1),
+            return_exceptions=True,
+        )
+        await connection.close()
+        return results
+
+    error, response = asyncio.run(run())
+    assert isinstance(error, OSError)
+    assert str(error) == "read failed"
+    assert response == b"2"
+
+
+def test_not_opened_before_connect_and_after_close(stream):
+    async def run():
+        connection = SerialConnection()
+        with pytest.raises(NotOpenedError):
+            await connection.send_command(b"GO")
+        with pytest.raises(NotOpenedError):
+            await connection.send_query(b"A?", 1)
+        with pytest.raises(NotOpenedError):
+            await connection.close()
+
+        await connection.connect(SETTINGS)
+        await connection.close()
+
+        with pytest.raises(NotOpenedError):
+            await connection.send_command(b"GO")
+        with pytest.raises(NotOpenedError):
+            await connection.close()
+
+    asyncio.run(run())
+    assert stream.closed
+
+
+def test_close_completes_in_flight_requests_and_rejects_new_ones(stream):
+    async def run():
+        connection = SerialConnection()
+        await connection.connect(SETTINGS)
+        query = asyncio.create_task(connection.send_query(b"A?", 1))
+        await wait_for_writes(stream, 1)
+
+        closing = asyncio.create_task(connection.close())
+        await asyncio.sleep(0)
+        with pytest.raises(NotOpenedError):
+            connection.ensure_open()
+        with pytest.raises(NotOpenedError):
+            await connection.send_command(b"LATE")
+
+        stream.feed(b"1")
+        assert await query == b"1"
+        await closing
+
+    asyncio.run(run())
+    assert stream.written == [b"A?"]
+    assert stream.closed
+
+
+def test_cancelled_close_fails_outstanding_requests(stream):
+    async def run():
+        connection = SerialConnection()
+        await connection.connect(SETTINGS)
+        query = asyncio.create_task(connection.send_query(b"A?", 1))
+        await wait_for_writes(stream, 1)
+
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(connection.close(), timeout=0.01)
+
+        with pytest.raises(NotOpenedError):
+            await query
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    asyncio.run(run())
+    assert stream.closed
+
+
+def test_connect_twice_replaces_stream():
+    first, second = FakeStream(), FakeStream()
+    second.replies = {b"A?": b"1", b"B?": b"2"}
+
+    async def run():
+        connection = SerialConnection()
+        with mock.patch("aioserial.AioSerial", side_effect=[first, second]):
+            await connection.connect(SETTINGS)
+            await connection.connect(SETTINGS)
+        # Only one writer and one reader alongside this task
+        assert len(asyncio.all_tasks()) == 3
+
+        responses = await asyncio.gather(
+            connection.send_query(b"A?", 1), connection.send_query(b"B?", 1)
+        )
+        await connection.close()
+        return responses
+
+    assert asyncio.run(run()) == [b"1", b"2"]
+    assert first.closed
+
+
+def test_send_query_into_returns_view_of_buffer(stream):
+    stream.replies = {b"A?": b"abcd"}
+    buffer = bytearray(4)
+
+    async def run():
+        connection = SerialConnection()
+        await connection.connect(SETTINGS)
+        view = await connection.send_query_into(b"A?", buffer)
+        await connection.close()
+        return view
+
+    view = asyncio.run(run())
+    assert isinstance(view, memoryview)
+    assert view.obj is buffer
+    assert bytes(view) == b"abcd"
+    assert buffer == b"abcd"